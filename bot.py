@@ -4,9 +4,13 @@ A Python implementation replicating Muse's functionality
 """
 import discord
 from discord.ext import commands
+import aiohttp
 import asyncio
+import hashlib
+import json
 import logging
 import os
+import signal
 import sys
 from typing import Optional
 from datetime import datetime, timezone
@@ -32,6 +36,9 @@ logger = logging.getLogger('hertz')
 logger.setLevel(logging.INFO)
 logger.addHandler(handler)
 
+# Hash of the last command tree synced to Discord
+COMMAND_HASH_FILE = "data/command_tree.sha1"
+
 class HertzBot(commands.Bot):
     """Main bot class for Hertz"""
     
@@ -43,10 +50,20 @@ class HertzBot(commands.Bot):
         intents.guilds = True
         intents.members = True
         
+        # Pooled keep-alive connections with DNS caching for Discord REST calls
+        connector = aiohttp.TCPConnector(
+            limit=200,
+            limit_per_host=32,
+            ttl_dns_cache=300,
+            use_dns_cache=True,
+            keepalive_timeout=75
+        )
+        
         super().__init__(
             command_prefix='/',  # We'll use slash commands primarily
             intents=intents,
             help_command=None,  # We'll create custom help
+            connector=connector,
             activity=discord.Activity(
                 type=discord.ActivityType.playing,
                 name=os.getenv('BOT_ACTIVITY', 'music 🎵')
@@ -56,21 +73,98 @@ class HertzBot(commands.Bot):
         # Fix deprecated datetime.utcnow() usage
         self.start_time = datetime.now(timezone.utc)
         self.version = "1.0.0"
+        self.first_ready = True
+        
+        # Set once shutdown() has finished closing the bot
+        self.shutdown_event = asyncio.Event()
+        self._shutdown_task = None
+        
+        # Shown in the ready banner; sync_commands runs in the background
+        self.sync_status = "Pending"
         
     async def setup_hook(self):
         """Initialize bot components before connecting to Discord"""
         logger.info("🎵 Setting up Hertz bot...")
         
+        # Handle SIGINT/SIGTERM on the event loop so shutdown runs cleanly
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self._on_signal, sig)
+            except NotImplementedError:
+                # Not supported on Windows; KeyboardInterrupt still applies
+                pass
+        
         # Load cogs
         await self.load_extensions()
         
-        # Sync slash commands
+        # Sync in the background so connecting to the gateway isn't held up
+        self._sync_task = asyncio.create_task(self.sync_commands())
+    
+    async def sync_commands(self):
+        """Sync slash commands only when the command tree changed"""
+        # The hash only lets us skip a sync; if it can't be computed, sync anyway
+        try:
+            tree_hash = self.command_tree_hash()
+            if tree_hash == self.load_command_hash():
+                logger.info("📡 Slash commands unchanged, skipping sync")
+                self.sync_status = "Unchanged, skipped"
+                return
+        except Exception as e:
+            logger.error(f"❌ Failed to hash command tree, syncing anyway: {e}")
+            tree_hash = None
+        
         logger.info("📡 Syncing slash commands...")
         try:
             synced = await self.tree.sync()
             logger.info(f"✅ Synced {len(synced)} slash commands")
+            self.sync_status = f"Synced {len(synced)}"
+            if tree_hash:
+                self.save_command_hash(tree_hash)
         except Exception as e:
             logger.error(f"❌ Failed to sync commands: {e}")
+            self.sync_status = "Failed"
+    
+    def command_tree_hash(self) -> str:
+        """Hash the local command tree payload for this application"""
+        payload = sorted(
+            (command.to_dict(self.tree) for command in self.tree.get_commands()),
+            key=lambda command: command['name']
+        )
+        data = json.dumps([self.application_id, payload], sort_keys=True)
+        return hashlib.sha1(data.encode()).hexdigest()
+    
+    def load_command_hash(self) -> Optional[str]:
+        """Load the hash of the last synced command tree"""
+        try:
+            with open(COMMAND_HASH_FILE, 'r') as f:
+                return f.read().strip()
+        except OSError:
+            return None
+    
+    def save_command_hash(self, tree_hash: str):
+        """Store the hash of the synced command tree"""
+        try:
+            os.makedirs(os.path.dirname(COMMAND_HASH_FILE), exist_ok=True)
+            with open(COMMAND_HASH_FILE, 'w') as f:
+                f.write(tree_hash)
+        except OSError as e:
+            logger.warning(f"⚠️ Failed to store command hash: {e}")
+    
+    def _on_signal(self, sig):
+        """Schedule a graceful shutdown when a termination signal arrives"""
+        if self._shutdown_task:
+            # Already shutting down; ignore repeated signals
+            return
+        logger.info(f"🛑 Received {signal.Signals(sig).name}, shutting down...")
+        self._shutdown_task = asyncio.create_task(self.shutdown())
+    
+    async def shutdown(self):
+        """Close the bot once, then notify main() that shutdown finished"""
+        if self.shutdown_event.is_set():
+            return
+        await self.close()
+        self.shutdown_event.set()
     
     async def load_extensions(self):
         """Load all cog extensions"""
@@ -82,28 +176,40 @@ class HertzBot(commands.Bot):
             'cogs.utils'
         ]
         
-        for cog in cogs:
-            try:
-                await self.load_extension(cog)
-                logger.info(f"✅ Loaded cog: {cog}")
-            except Exception as e:
-                logger.error(f"❌ Failed to load cog {cog}: {e}")
+        # Cogs are independent, so load them concurrently
+        await asyncio.gather(*(self._load_cog(cog) for cog in cogs))
+    
+    async def _load_cog(self, cog: str):
+        """Load a single cog, logging failures without aborting startup"""
+        try:
+            await self.load_extension(cog)
+            logger.info(f"✅ Loaded cog: {cog}")
+        except Exception as e:
+            logger.error(f"❌ Failed to load cog {cog}: {e}")
     
     async def on_ready(self):
         """Called when bot is ready"""
+        # on_ready fires again after reconnects; only announce the first one
+        if not self.first_ready:
+            logger.info(f"🔄 Reconnected to Discord as {self.user}")
+            return
+        self.first_ready = False
+        
+        invite_url = discord.utils.oauth_url(self.user.id, permissions=discord.Permissions(2150657024))
+        
         logger.info(f"🤖 {self.user} is ready and connected to Discord!")
         logger.info(f"📊 Connected to {len(self.guilds)} guilds")
         logger.info(f"🔗 Bot Invite URL:")
-        logger.info(f"   {discord.utils.oauth_url(self.user.id, permissions=discord.Permissions(2150657024))}")
+        logger.info(f"   {invite_url}")
         
         print("\n" + "="*80)
         print("🎵 HERTZ DISCORD MUSIC BOT - READY")
         print("="*80)
         print(f"✅ Bot Online: {self.user}")
         print(f"🏠 Guilds: {len(self.guilds)}")
-        print(f"📡 Commands: Synced")
+        print(f"📡 Commands: {self.sync_status}")
         print(f"🔗 Invite URL:")
-        print(f"   {discord.utils.oauth_url(self.user.id, permissions=discord.Permissions(2150657024))}")
+        print(f"   {invite_url}")
         print("="*80 + "\n")
         
         logger.info("🚀 Hertz is fully ready!")
@@ -165,7 +271,13 @@ async def main():
     
     try:
         logger.info("🔐 Starting Discord connection...")
-        await bot.start(token)
+        start_task = asyncio.create_task(bot.start(token))
+        shutdown_task = asyncio.create_task(bot.shutdown_event.wait())
+        await asyncio.wait({start_task, shutdown_task}, return_when=asyncio.FIRST_COMPLETED)
+        shutdown_task.cancel()
+        
+        # Returns once the connection is closed; re-raises connection errors
+        await start_task
     except KeyboardInterrupt:
         logger.info("🛑 Received interrupt signal, shutting down...")
     except Exception as e:
@@ -175,8 +287,18 @@ async def main():
         logger.info("🛑 Shutting down Hertz...")
         await bot.close()
 
-if __name__ == "__main__":
+def run():
+    """Run main() on uvloop when available, falling back to asyncio"""
     try:
+        import uvloop
+    except ImportError:
+        # uvloop is POSIX-only and optional
         asyncio.run(main())
+    else:
+        uvloop.run(main())
+
+if __name__ == "__main__":
+    try:
+        run()
     except KeyboardInterrupt:
         print("\n✅ Shutdown complete")
\ No newline at end of file
@@ -4,14 +4,19 @@ Configuration Cog - Bot settings and server configuration
 import discord
 from discord.ext import commands
 from discord import app_commands
+import asyncio
 import logging
 import json
 import os
 from typing import Optional
-from datetime import datetime, timezone
+
+from utils.formatting import error_embed
 
 logger = logging.getLogger('hertz.config')
 
+# Seconds to wait before writing settings, so bursts of changes share one write
+SAVE_DELAY = 0.5
+
 class Config(commands.Cog):
     """Configuration and settings commands"""
     
@@ -19,6 +24,15 @@ class Config(commands.Cog):
         self.bot = bot
         self.settings_file = "data/guild_settings.json"
         self.guild_settings = self.load_settings()
+        self._save_task = None
+        self._dirty = False
+    
+    async def cog_unload(self):
+        """Flush any pending settings write"""
+        # Let the pending save finish rather than cancelling it; its thread may
+        # already be writing the temp file, and a second writer could race it
+        if self._save_task and not self._save_task.done():
+            await self._save_task
     
     def load_settings(self) -> dict:
         """Load guild settings from file"""
@@ -31,10 +45,32 @@ class Config(commands.Cog):
         return {}
     
     def save_settings(self):
-        """Save guild settings to file"""
+        """Schedule a save of guild settings, coalescing rapid changes"""
+        self._dirty = True
+        if self._save_task is None or self._save_task.done():
+            self._save_task = asyncio.create_task(self._save_later())
+    
+    async def _save_later(self):
+        """Write settings after a short delay, off the event loop"""
+        # Changes made while a write is in flight are picked up by the next pass
+        while self._dirty:
+            await asyncio.sleep(SAVE_DELAY)
+            self._dirty = False
+            try:
+                # Serialize here so the worker thread never sees the dict mid-update
+                data = json.dumps(self.guild_settings, indent=2)
+                await asyncio.to_thread(self._write_file, data)
+            except Exception as e:
+                logger.error(f"Failed to save guild settings: {e}")
+    
+    def _write_file(self, data: str):
         os.makedirs(os.path.dirname(self.settings_file), exist_ok=True)
-        with open(self.settings_file, 'w') as f:
-            json.dump(self.guild_settings, f, indent=2)
+        # Write beside the target and swap it in, so a crash mid-write never
+        # leaves a truncated file that load_settings would silently discard
+        tmp_file = f"{self.settings_file}.tmp"
+        with open(tmp_file, 'w') as f:
+            f.write(data)
+        os.replace(tmp_file, self.settings_file)
     
     def get_guild_settings(self, guild_id: int) -> dict:
         """Get settings for a guild"""
@@ -123,11 +159,7 @@ class Config(commands.Cog):
     async def setvolume(self, interaction: discord.Interaction, level: int):
         """Set default volume for the guild"""
         if level < 0 or level > 100:
-            embed = discord.Embed(
-                title="❌ Invalid Volume",
-                description="Volume must be between 0 and 100!",
-                color=0xff0000
-            )
+            embed = error_embed("❌ Invalid Volume", "Volume must be between 0 and 100!")
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
         
@@ -5,15 +5,22 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 import asyncio
+import functools
+import itertools
+import random
+from collections import deque
 import yt_dlp
 import re
+import time
 import logging
 import spotipy
 from spotipy.oauth2 import SpotifyClientCredentials
-from datetime import datetime, timezone
-from typing import List, Dict, Optional
+from dataclasses import dataclass
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
 import os
 
+from utils.formatting import error_embed, format_duration, info_embed
+
 logger = logging.getLogger('hertz.music')
 
 # yt-dlp options
@@ -40,6 +47,111 @@ FFMPEG_OPTIONS = {
     'options': '-vn -filter:a "volume=0.5"'
 }
 
+# Process-wide source of MusicQueue versions; never reused, so a guild's new
+# player can't collide with page text rendered for its previous one
+QUEUE_VERSIONS = itertools.count()
+
+# Maximum number of autocomplete searches kept in memory
+SEARCH_CACHE_SIZE = 512
+
+# Maximum number of YouTube lookups run at once when resolving a playlist
+SEARCH_CONCURRENCY = 5
+
+# URL/URI prefixes handled by SpotifyHandler
+SPOTIFY_PREFIXES = (
+    'https://open.spotify.com/',
+    'http://open.spotify.com/',
+    'https://play.spotify.com/',
+    'https://spotify.com/',
+    'open.spotify.com/',
+    'play.spotify.com/',
+    'spotify.com/',
+    'spotify:'
+)
+
+# spotipy request timeout (seconds) and bounded retry/backoff for 429s and 5xx;
+# Retry-After is honoured by the underlying urllib3 retry
+SPOTIFY_TIMEOUT = 10
+SPOTIFY_RETRIES = 5
+SPOTIFY_BACKOFF = 0.5
+
+# Most tracks queued from one Spotify playlist or album; only this many are
+# fetched, since each one costs a YouTube lookup
+SPOTIFY_TRACK_LIMIT = 50
+
+# Playlist items requested per lookup (the API maximum), leaving room for
+# unavailable entries that are skipped before the limit is applied
+SPOTIFY_PLAYLIST_PAGE = 100
+
+# Resolved Spotify lookups kept in memory, and how long (seconds) they stay valid
+SPOTIFY_CACHE_SIZE = 2048
+SPOTIFY_CACHE_TTL = 86400
+SPOTIFY_PLAYLIST_TTL = 300
+
+# Matches track, playlist and album URLs/URIs in a single pass
+SPOTIFY_ID_PATTERN = re.compile(
+    r'spotify(?:\.com)?[:/](?P<type>track|playlist|album)[:/](?P<id>[a-zA-Z0-9]+)'
+)
+
+
+def is_spotify_url(query: str) -> bool:
+    """
+    Check whether a query is a Spotify URL or URI
+    
+    >>> is_spotify_url('https://open.spotify.com/track/ID')
+    True
+    >>> is_spotify_url('open.spotify.com/track/ID')
+    True
+    >>> is_spotify_url('spotify:album:ID')
+    True
+    >>> is_spotify_url('never gonna give you up')
+    False
+    """
+    return query.startswith(SPOTIFY_PREFIXES)
+
+
+def clean_query(query: str) -> str:
+    """
+    Strip whitespace and the <> Discord users wrap links in to hide embeds
+    
+    >>> clean_query(' <https://open.spotify.com/track/ID> ')
+    'https://open.spotify.com/track/ID'
+    >>> clean_query('<3 song')
+    '<3 song'
+    """
+    query = query.strip()
+    if query.startswith('<') and query.endswith('>'):
+        query = query[1:-1].strip()
+    return query
+
+
+def _summary_embed(tracks: List['TrackInfo'], queue_size: int) -> discord.Embed:
+    """Build the embed confirming tracks were added to the queue"""
+    if len(tracks) > 1:
+        return info_embed("✅ Spotify Playlist Added", f"Added {len(tracks)} tracks to the queue!")
+    
+    track = tracks[0]
+    fields = []
+    
+    if track.duration:
+        duration = format_duration(track.duration)
+        fields.append({"name": "Duration", "value": duration, "inline": True})
+    
+    if queue_size > 1:
+        fields.append({"name": "Position in Queue", "value": str(queue_size), "inline": True})
+    
+    payload = {
+        "title": "✅ Track Added",
+        "description": f"**[{track.title}]({track.webpage_url})**",
+        "color": 0x00ff00,
+        "fields": fields
+    }
+    
+    if track.thumbnail:
+        payload["thumbnail"] = {"url": track.thumbnail}
+    
+    return discord.Embed.from_dict(payload)
+
 
 class SpotifyHandler:
     """Handle Spotify URL processing"""
@@ -50,6 +162,8 @@ class SpotifyHandler:
         
         self.enabled = bool(client_id and client_secret)
         self.sp = None
+        self.cache: Dict[Tuple[str, str], Tuple[float, List[str]]] = {}
+        self.inflight: Dict[Tuple[str, str], asyncio.Task] = {}
         
         if self.enabled:
             try:
@@ -57,7 +171,13 @@ class SpotifyHandler:
                     client_id=client_id,
                     client_secret=client_secret
                 )
-                self.sp = spotipy.Spotify(client_credentials_manager=credentials)
+                self.sp = spotipy.Spotify(
+                    client_credentials_manager=credentials,
+                    requests_timeout=SPOTIFY_TIMEOUT,
+                    retries=SPOTIFY_RETRIES,
+                    status_retries=SPOTIFY_RETRIES,
+                    backoff_factor=SPOTIFY_BACKOFF
+                )
                 logger.info("✅ Spotify integration enabled")
             except Exception as e:
                 logger.warning(f"⚠️ Spotify setup failed: {e}")
@@ -67,16 +187,9 @@ class SpotifyHandler:
     
     def extract_spotify_id(self, url: str) -> tuple:
         """Extract Spotify ID and type from URL"""
-        patterns = {
-            'track': r'spotify(?:\.com)?[:/]track[:/]([a-zA-Z0-9]+)',
-            'playlist': r'spotify(?:\.com)?[:/]playlist[:/]([a-zA-Z0-9]+)',
-            'album': r'spotify(?:\.com)?[:/]album[:/]([a-zA-Z0-9]+)'
-        }
-        
-        for type_, pattern in patterns.items():
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1), type_
+        match = SPOTIFY_ID_PATTERN.search(url)
+        if match:
+            return match['id'], match['type']
         
         return None, None
     
@@ -89,34 +202,186 @@ class SpotifyHandler:
         if not spotify_id:
             return []
         
-        queries = []
-        
+        # Check cache; playlists change, tracks and albums effectively don't
+        cache_key = (content_type, spotify_id)
+        ttl = SPOTIFY_PLAYLIST_TTL if content_type == 'playlist' else SPOTIFY_CACHE_TTL
+        if cache_key in self.cache:
+            cached_time, queries = self.cache[cache_key]
+            if time.monotonic() - cached_time < ttl:
+                return queries
+            del self.cache[cache_key]
+        
+        # Concurrent /play calls for the same link share one API lookup
+        task = self.inflight.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(self._load_tracks(spotify_id, content_type, cache_key))
+            self.inflight[cache_key] = task
+            task.add_done_callback(lambda _: self.inflight.pop(cache_key, None))
+        
+        # Shield so one cancelled caller doesn't cancel the lookup for the rest
+        return await asyncio.shield(task)
+    
+    async def _load_tracks(self, spotify_id: str, content_type: str, cache_key: Tuple[str, str]) -> List[str]:
+        """Fetch track queries from the API and cache them"""
+        # spotipy is blocking and sleeps between retries, so keep it off the loop
+        loop = asyncio.get_running_loop()
         try:
-            if content_type == 'track':
-                track = self.sp.track(spotify_id)
-                artist = track['artists'][0]['name']
-                title = track['name']
-                queries.append(f"{artist} {title}")
-                
-            elif content_type == 'playlist':
-                playlist = self.sp.playlist_tracks(spotify_id, limit=100)
-                for item in playlist['items']:
-                    if item['track']:
-                        artist = item['track']['artists'][0]['name']
-                        title = item['track']['name']
-                        queries.append(f"{artist} {title}")
-                
-            elif content_type == 'album':
-                album = self.sp.album_tracks(spotify_id, limit=50)
-                for track in album['items']:
-                    artist = track['artists'][0]['name']
-                    title = track['name']
-                    queries.append(f"{artist} {title}")
-                    
+            queries = await loop.run_in_executor(
+                None, self._fetch_queries, spotify_id, content_type
+            )
         except Exception as e:
             logger.error(f"Spotify API error: {e}")
+            return []
+        
+        # Cache results, evicting the oldest entry once the cache is full
+        self.cache[cache_key] = (time.monotonic(), queries)
+        if len(self.cache) > SPOTIFY_CACHE_SIZE:
+            del self.cache[next(iter(self.cache))]
         
         return queries
+    
+    def _fetch_queries(self, spotify_id: str, content_type: str) -> List[str]:
+        """Fetch "artist title" queries from the Spotify API (blocking)"""
+        if content_type == 'track':
+            track = self.sp.track(spotify_id)
+            return [f"{track['artists'][0]['name']} {track['name']}"]
+        
+        if content_type == 'playlist':
+            # Only ask for the fields the search query needs; fetch a full page
+            # so tracks removed from Spotify (returned as null) don't eat into
+            # the limit
+            playlist = self.sp.playlist_tracks(
+                spotify_id,
+                fields='items(track(name,artists(name)))',
+                limit=SPOTIFY_PLAYLIST_PAGE
+            )
+            tracks = [item['track'] for item in playlist['items'] if item['track']]
+            tracks = tracks[:SPOTIFY_TRACK_LIMIT]
+        elif content_type == 'album':
+            tracks = self.sp.album_tracks(spotify_id, limit=SPOTIFY_TRACK_LIMIT)['items']
+        else:
+            return []
+        
+        # Build every query in one comprehension rather than per-item appends
+        return [f"{track['artists'][0]['name']} {track['name']}" for track in tracks]
+
+
+@dataclass(slots=True, frozen=True)
+class TrackInfo:
+    """Compact queue entry holding only the fields needed to display and play a track"""
+    title: str
+    webpage_url: str
+    duration: Optional[int] = None
+    thumbnail: Optional[str] = None
+    requester: Optional[discord.abc.User] = None
+    
+    @classmethod
+    def from_data(cls, data: dict, requester=None) -> 'TrackInfo':
+        """Build track info from a yt-dlp info dict"""
+        return cls(
+            title=data.get('title', 'Unknown'),
+            webpage_url=data.get('webpage_url') or data.get('url'),
+            duration=data.get('duration'),
+            thumbnail=data.get('thumbnail'),
+            requester=requester
+        )
+
+
+class MusicQueue:
+    """Track queue for a guild player, supporting bulk adds and in-place edits"""
+    
+    def __init__(self):
+        self._tracks: Deque[TrackInfo] = deque()
+        self._not_empty = asyncio.Event()
+        
+        # Running sum of queued durations, kept in step with every mutation
+        self.total_duration = 0
+        
+        # Changed on every mutation so rendered views can be reused until it does
+        self.version = next(QUEUE_VERSIONS)
+    
+    def __len__(self) -> int:
+        return len(self._tracks)
+    
+    def __iter__(self) -> Iterator[TrackInfo]:
+        return iter(self._tracks)
+    
+    def empty(self) -> bool:
+        """Check whether the queue has no tracks"""
+        return not self._tracks
+    
+    def qsize(self) -> int:
+        """Number of queued tracks"""
+        return len(self._tracks)
+    
+    def put_nowait(self, track: TrackInfo):
+        """Add a track to the end of the queue"""
+        self._tracks.append(track)
+        self.total_duration += track.duration or 0
+        self.version = next(QUEUE_VERSIONS)
+        self._not_empty.set()
+    
+    async def put(self, track: TrackInfo):
+        """Add a track to the end of the queue"""
+        self.put_nowait(track)
+    
+    def add_multiple(self, tracks: List[TrackInfo]) -> int:
+        """Add several tracks at once, waking the player a single time"""
+        self._tracks.extend(tracks)
+        self.total_duration += sum(track.duration or 0 for track in tracks)
+        self.version = next(QUEUE_VERSIONS)
+        if self._tracks:
+            self._not_empty.set()
+        return len(self._tracks)
+    
+    def remove(self, index: int) -> TrackInfo:
+        """Remove and return the track at a zero-based index"""
+        track = self._tracks[index]
+        del self._tracks[index]
+        self.total_duration -= track.duration or 0
+        self.version = next(QUEUE_VERSIONS)
+        return track
+    
+    def move(self, from_index: int, to_index: int) -> TrackInfo:
+        """Move the track at from_index to to_index, returning it"""
+        track = self._tracks[from_index]
+        del self._tracks[from_index]
+        self._tracks.insert(to_index, track)
+        self.version = next(QUEUE_VERSIONS)
+        return track
+    
+    def shuffle(self) -> int:
+        """Shuffle the queued tracks, returning how many were shuffled"""
+        random.shuffle(self._tracks)
+        self.version = next(QUEUE_VERSIONS)
+        return len(self._tracks)
+    
+    def clear(self) -> int:
+        """Remove all tracks, returning how many were removed"""
+        count = len(self._tracks)
+        self._tracks.clear()
+        self.total_duration = 0
+        self.version = next(QUEUE_VERSIONS)
+        return count
+    
+    def get_nowait(self) -> TrackInfo:
+        """Remove and return the next track, raising QueueEmpty if there is none"""
+        if not self._tracks:
+            raise asyncio.QueueEmpty
+        return self._popleft()
+    
+    async def get(self) -> TrackInfo:
+        """Remove and return the next track, waiting until one is available"""
+        while not self._tracks:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        return self._popleft()
+    
+    def _popleft(self) -> TrackInfo:
+        track = self._tracks.popleft()
+        self.total_duration -= track.duration or 0
+        self.version = next(QUEUE_VERSIONS)
+        return track
 
 
 class YTDLSource(discord.PCMVolumeTransformer):
@@ -132,12 +397,12 @@ class YTDLSource(discord.PCMVolumeTransformer):
         self.thumbnail = data.get('thumbnail')
         self.artist = data.get('artist', 'Unknown Artist')
         self.requester = data.get('requester')
-        self.added_at = datetime.now(timezone.utc)
+        self.started_at = time.monotonic()
     
     @classmethod
     async def from_url(cls, url: str, *, loop=None, stream=True, requester=None):
         """Create audio source from URL"""
-        loop = loop or asyncio.get_event_loop()
+        loop = loop or asyncio.get_running_loop()
         
         # Extract info
         with yt_dlp.YoutubeDL(YDL_OPTIONS) as ydl:
@@ -166,9 +431,9 @@ class YTDLSource(discord.PCMVolumeTransformer):
         return cls(source, data=data)
     
     @classmethod
-    async def search(cls, query: str, *, loop=None, requester=None):
+    async def search(cls, query: str, *, loop=None, requester=None) -> Optional[TrackInfo]:
         """Search YouTube and return first result"""
-        loop = loop or asyncio.get_event_loop()
+        loop = loop or asyncio.get_running_loop()
         
         # Add ytsearch if not a URL
         if not query.startswith(('http://', 'https://')):
@@ -184,13 +449,14 @@ class YTDLSource(discord.PCMVolumeTransformer):
                 logger.error(f"Search error: {e}")
                 return None
         
-        if 'entries' in data and data['entries']:
-            # Return first search result
-            source_data = data['entries'][0]
-            source_data['requester'] = requester
-            return source_data
+        # Search results come back as entries; direct URLs as a single video
+        if 'entries' in data:
+            if not data['entries']:
+                return None
+            data = data['entries'][0]
         
-        return None
+        # Keep only what the queue needs instead of the full info dict
+        return TrackInfo.from_data(data, requester)
 
 
 class GuildMusicPlayer:
@@ -202,7 +468,7 @@ class GuildMusicPlayer:
         self.channel = interaction.channel
         self.cog = interaction.client.get_cog('Music')
         
-        self.queue = asyncio.Queue()
+        self.queue = MusicQueue()
         self.next = asyncio.Event()
         
         self.current = None
@@ -224,25 +490,25 @@ class GuildMusicPlayer:
             try:
                 # Wait for next track with timeout
                 async with asyncio.timeout(300):  # 5 minute timeout
-                    source = await self.queue.get()
+                    track = await self.queue.get()
             except asyncio.TimeoutError:
                 # Disconnect after timeout
                 if self.voice_client and self.voice_client.is_connected():
                     await self.voice_client.disconnect()
                     break
+                continue
             
             # Create audio source
-            if not isinstance(source, YTDLSource):
-                try:
-                    source = await YTDLSource.from_url(
-                        source['webpage_url'],
-                        loop=self.bot.loop,
-                        stream=True,
-                        requester=source.get('requester')
-                    )
-                except Exception as e:
-                    logger.error(f"Error creating audio source: {e}")
-                    continue
+            try:
+                source = await YTDLSource.from_url(
+                    track.webpage_url,
+                    loop=self.bot.loop,
+                    stream=True,
+                    requester=track.requester
+                )
+            except Exception as e:
+                logger.error(f"Error creating audio source: {e}")
+                continue
             
             source.volume = self.volume
             self.current = source
@@ -263,10 +529,10 @@ class GuildMusicPlayer:
                 # Handle loop modes
                 if self.loop_mode == 'track' and self.current:
                     # Re-add current track
-                    await self.queue.put(self.current.data)
+                    await self.queue.put(track)
                 elif self.loop_mode == 'queue' and self.current:
                     # Add to back of queue list
-                    self.queue_list.append(self.current.data)
+                    self.queue_list.append(track)
                     
                     # If queue is empty, refill from queue_list
                     if self.queue.empty() and self.queue_list:
@@ -281,17 +547,13 @@ class GuildMusicPlayer:
         if not self.current:
             return
         
-        embed = discord.Embed(
-            title="🎵 Now Playing",
-            description=f"**[{self.current.title}]({self.current.webpage_url})**",
-            color=0x00ff00
-        )
+        embed = info_embed("🎵 Now Playing", f"**[{self.current.title}]({self.current.webpage_url})**")
         
         if self.current.thumbnail:
             embed.set_thumbnail(url=self.current.thumbnail)
         
         if self.current.duration:
-            duration = f"{self.current.duration // 60}:{self.current.duration % 60:02d}"
+            duration = format_duration(self.current.duration)
             embed.add_field(name="Duration", value=duration, inline=True)
         
         embed.add_field(name="Volume", value=f"{int(self.volume * 100)}%", inline=True)
@@ -326,12 +588,17 @@ class Music(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.players = {}
-        self.spotify = SpotifyHandler()
         
         # Search cache for autocomplete
         self.search_cache = {}
+        self.search_inflight: Dict[str, asyncio.Task] = {}
         self.cache_ttl = 3600  # 1 hour
     
+    @functools.cached_property
+    def spotify(self) -> SpotifyHandler:
+        """Spotify handler, created the first time a Spotify link is played"""
+        return SpotifyHandler()
+    
     def get_player(self, interaction) -> GuildMusicPlayer:
         """Get or create player for guild"""
         try:
@@ -344,14 +611,30 @@ class Music(commands.Cog):
     
     async def search_youtube(self, query: str, limit: int = 5) -> List[Dict]:
         """Search YouTube and return results"""
+        # Normalize once so case/spacing variants of a query share a cache entry
+        query = ' '.join(query.split()).lower()
+        
         # Check cache
         cache_key = f"{query}:{limit}"
         if cache_key in self.search_cache:
             cached_time, results = self.search_cache[cache_key]
-            if (datetime.now(timezone.utc) - cached_time).seconds < self.cache_ttl:
+            if time.monotonic() - cached_time < self.cache_ttl:
                 return results
-        
-        # Search YouTube
+            del self.search_cache[cache_key]
+        
+        # Identical searches in flight (autocomplete fires per keystroke, for
+        # every user) share one lookup instead of each running yt-dlp
+        task = self.search_inflight.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(self._search_youtube(query, limit, cache_key))
+            self.search_inflight[cache_key] = task
+            task.add_done_callback(lambda _: self.search_inflight.pop(cache_key, None))
+        
+        # Shield so one cancelled caller doesn't cancel the lookup for the rest
+        return await asyncio.shield(task)
+    
+    async def _search_youtube(self, query: str, limit: int, cache_key: str) -> List[Dict]:
+        """Run a YouTube search and cache its results"""
         with yt_dlp.YoutubeDL({**YDL_OPTIONS, 'quiet': True}) as ydl:
             try:
                 data = await self.bot.loop.run_in_executor(
@@ -362,18 +645,20 @@ class Music(commands.Cog):
                 logger.error(f"YouTube search error: {e}")
                 return []
         
-        results = []
-        if 'entries' in data:
-            for entry in data['entries'][:limit]:
-                results.append({
-                    'title': entry.get('title', 'Unknown'),
-                    'url': entry.get('webpage_url', ''),
-                    'duration': entry.get('duration', 0),
-                    'channel': entry.get('channel', 'Unknown')
-                })
-        
-        # Cache results
-        self.search_cache[cache_key] = (datetime.now(timezone.utc), results)
+        results = [
+            {
+                'title': entry.get('title', 'Unknown'),
+                'url': entry.get('webpage_url', ''),
+                'duration': entry.get('duration', 0),
+                'channel': entry.get('channel', 'Unknown')
+            }
+            for entry in data.get('entries', ())[:limit]
+        ]
+        
+        # Cache results, evicting the oldest entry once the cache is full
+        self.search_cache[cache_key] = (time.monotonic(), results)
+        if len(self.search_cache) > SEARCH_CACHE_SIZE:
+            del self.search_cache[next(iter(self.search_cache))]
         
         return results
     
@@ -381,19 +666,22 @@ class Music(commands.Cog):
     @app_commands.describe(query="Song name, YouTube URL, or Spotify URL")
     async def play(self, interaction: discord.Interaction, query: str):
         """Play command with autocomplete"""
-        # Defer response
-        await interaction.response.defer()
+        query = clean_query(query)
         
-        # Check if user is in voice channel
+        # Reject cheap validation failures directly, before deferring
         if not interaction.user.voice:
-            embed = discord.Embed(
-                title="❌ Not in Voice Channel",
-                description="You need to be in a voice channel to use this command!",
-                color=0xff0000
-            )
-            await interaction.followup.send(embed=embed, ephemeral=True)
+            embed = error_embed("❌ Not in Voice Channel", "You need to be in a voice channel to use this command!")
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            return
+        
+        if is_spotify_url(query) and not self.spotify.enabled:
+            embed = error_embed("❌ Spotify Not Available", "Spotify integration is not configured!")
+            await interaction.response.send_message(embed=embed, ephemeral=True)
             return
         
+        # Defer response for the slow connect/resolve path
+        await interaction.response.defer()
+        
         # Get or create player
         player = self.get_player(interaction)
         
@@ -404,106 +692,84 @@ class Music(commands.Cog):
                 player.voice_client = voice_client
                 logger.info(f"🔗 Connected to {interaction.user.voice.channel.name}")
             except Exception as e:
-                embed = discord.Embed(
-                    title="❌ Connection Failed",
-                    description=f"Failed to connect to voice channel: {e}",
-                    color=0xff0000
-                )
+                embed = error_embed("❌ Connection Failed", f"Failed to connect to voice channel: {e}")
                 await interaction.followup.send(embed=embed, ephemeral=True)
                 return
         else:
             player.voice_client = interaction.guild.voice_client
         
-        # Handle Spotify URLs
-        if 'spotify.com' in query:
-            if not self.spotify.enabled:
-                embed = discord.Embed(
-                    title="❌ Spotify Not Available",
-                    description="Spotify integration is not configured!",
-                    color=0xff0000
-                )
-                await interaction.followup.send(embed=embed, ephemeral=True)
-                return
-            
-            # Get tracks from Spotify
-            tracks = await self.spotify.get_tracks(query)
-            if not tracks:
-                embed = discord.Embed(
-                    title="❌ No Tracks Found",
-                    description="No tracks found from Spotify URL!",
-                    color=0xff0000
-                )
-                await interaction.followup.send(embed=embed, ephemeral=True)
-                return
-            
-            # Add tracks to queue
-            added_count = 0
-            for track_query in tracks[:50]:  # Limit to 50 tracks
-                source_data = await YTDLSource.search(
-                    track_query,
-                    loop=self.bot.loop,
-                    requester=interaction.user
-                )
-                if source_data:
-                    await player.queue.put(source_data)
-                    added_count += 1
-            
-            embed = discord.Embed(
-                title="✅ Spotify Playlist Added",
-                description=f"Added {added_count} tracks to the queue!",
-                color=0x00ff00
-            )
-            await interaction.followup.send(embed=embed)
-            return
-        
-        # Handle regular search/URL
         try:
-            source_data = await YTDLSource.search(
-                query,
-                loop=self.bot.loop,
-                requester=interaction.user
+            # Tracks are queued as they resolve, so playback starts early
+            tracks, queue_size, from_spotify = await self._resolve(
+                query, interaction.user, player.queue
             )
             
-            if not source_data:
-                embed = discord.Embed(
-                    title="❌ No Results",
-                    description="No results found for your search!",
-                    color=0xff0000
-                )
+            if not tracks:
+                if from_spotify:
+                    embed = error_embed("❌ No Tracks Found", "No tracks found from Spotify URL!")
+                else:
+                    embed = error_embed("❌ No Results", "No results found for your search!")
                 await interaction.followup.send(embed=embed, ephemeral=True)
                 return
             
-            # Add to queue
-            await player.queue.put(source_data)
-            
-            embed = discord.Embed(
-                title="✅ Track Added",
-                description=f"**[{source_data['title']}]({source_data['webpage_url']})**",
-                color=0x00ff00
-            )
-            
-            if source_data.get('thumbnail'):
-                embed.set_thumbnail(url=source_data['thumbnail'])
-            
-            if source_data.get('duration'):
-                duration = f"{source_data['duration'] // 60}:{source_data['duration'] % 60:02d}"
-                embed.add_field(name="Duration", value=duration, inline=True)
-            
-            queue_size = player.queue.qsize()
-            if queue_size > 1:
-                embed.add_field(name="Position in Queue", value=str(queue_size), inline=True)
-            
+            embed = _summary_embed(tracks, queue_size)
             await interaction.followup.send(embed=embed)
             
         except Exception as e:
-            logger.error(f"Play command error: {e}")
-            embed = discord.Embed(
-                title="❌ Playback Error",
-                description="An error occurred while trying to play this track!",
-                color=0xff0000
-            )
+            logger.error(f"Play command error: {e}", exc_info=True)
+            embed = error_embed("❌ Playback Error", "An error occurred while trying to play this track!")
             await interaction.followup.send(embed=embed, ephemeral=True)
     
+    async def _resolve(self, query: str, requester, queue: MusicQueue) -> Tuple[List[TrackInfo], int, bool]:
+        """
+        Resolve a query and add its tracks to the queue in order as they arrive
+        Returns (tracks, queue_size, from_spotify)
+        """
+        from_spotify = is_spotify_url(query)
+        if from_spotify:
+            queries = await self.spotify.get_tracks(query)
+        else:
+            queries = [query]
+        
+        # Look tracks up concurrently, bounded so YouTube doesn't throttle us
+        semaphore = asyncio.Semaphore(SEARCH_CONCURRENCY)
+        
+        async def search(track_query: str) -> Optional[TrackInfo]:
+            async with semaphore:
+                return await YTDLSource.search(
+                    track_query,
+                    loop=self.bot.loop,
+                    requester=requester
+                )
+        
+        lookups = [asyncio.create_task(search(q)) for q in queries]
+        tracks = []
+        queue_size = len(queue)
+        
+        try:
+            # Wait on lookups in playlist order, then queue that track together
+            # with every later one already finished, so the first song starts
+            # playing without waiting for the whole playlist
+            i = 0
+            while i < len(lookups):
+                await lookups[i]
+                batch = []
+                while i < len(lookups) and lookups[i].done():
+                    track = lookups[i].result()
+                    if track:
+                        batch.append(track)
+                    i += 1
+                
+                if batch:
+                    queue_size = queue.add_multiple(batch)
+                    tracks.extend(batch)
+        finally:
+            # Don't leave lookups running if the command itself fails
+            for lookup in lookups:
+                lookup.cancel()
+        
+        return tracks, queue_size, from_spotify
+    
     @play.autocomplete('query')
     async def play_autocomplete(self, interaction: discord.Interaction, current: str) -> List[app_commands.Choice]:
         """Autocomplete for play command"""
@@ -518,7 +784,7 @@ class Music(commands.Cog):
             # Format duration
             duration = result['duration']
             if duration:
-                duration_str = f"{duration // 60}:{duration % 60:02d}"
+                duration_str = format_duration(duration)
             else:
                 duration_str = "Live"
             
@@ -534,21 +800,13 @@ class Music(commands.Cog):
     async def skip(self, interaction: discord.Interaction):
         """Skip current track"""
         if not interaction.guild.voice_client:
-            embed = discord.Embed(
-                title="❌ Not Playing",
-                description="Nothing is currently playing!",
-                color=0xff0000
-            )
+            embed = error_embed("❌ Not Playing", "Nothing is currently playing!")
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
         
         interaction.guild.voice_client.stop()
         
-        embed = discord.Embed(
-            title="⏭️ Skipped",
-            description="Skipped to the next track!",
-            color=0x00ff00
-        )
+        embed = info_embed("⏭️ Skipped", "Skipped to the next track!")
         await interaction.response.send_message(embed=embed)
     
     @app_commands.command(name="pause", description="Pause playback")
@@ -557,29 +815,17 @@ class Music(commands.Cog):
         vc = interaction.guild.voice_client
         
         if not vc or not vc.is_playing():
-            embed = discord.Embed(
-                title="❌ Not Playing",
-                description="Nothing is currently playing!",
-                color=0xff0000
-            )
+            embed = error_embed("❌ Not Playing", "Nothing is currently playing!")
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
         
         if vc.is_paused():
-            embed = discord.Embed(
-                title="⏸️ Already Paused",
-                description="Playback is already paused!",
-                color=0xffff00
-            )
+            embed = info_embed("⏸️ Already Paused", "Playback is already paused!", 0xffff00)
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
         
         vc.pause()
-        embed = discord.Embed(
-            title="⏸️ Paused",
-            description="Playback has been paused!",
-            color=0x00ff00
-        )
+        embed = info_embed("⏸️ Paused", "Playback has been paused!")
         await interaction.response.send_message(embed=embed)
     
     @app_commands.command(name="resume", description="Resume playback")
@@ -588,29 +834,17 @@ class Music(commands.Cog):
         vc = interaction.guild.voice_client
         
         if not vc:
-            embed = discord.Embed(
-                title="❌ Not Playing",
-                description="Nothing is currently playing!",
-                color=0xff0000
-            )
+            embed = error_embed("❌ Not Playing", "Nothing is currently playing!")
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
         
         if not vc.is_paused():
-            embed = discord.Embed(
-                title="▶️ Not Paused",
-                description="Playback is not paused!",
-                color=0xffff00
-            )
+            embed = info_embed("▶️ Not Paused", "Playback is not paused!", 0xffff00)
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
         
         vc.resume()
-        embed = discord.Embed(
-            title="▶️ Resumed",
-            description="Playback has been resumed!",
-            color=0x00ff00
-        )
+        embed = info_embed("▶️ Resumed", "Playback has been resumed!")
         await interaction.response.send_message(embed=embed)
     
     @app_commands.command(name="stop", description="Stop playback and clear queue")
@@ -619,29 +853,17 @@ class Music(commands.Cog):
         player = self.players.get(interaction.guild.id)
         
         if not player or not interaction.guild.voice_client:
-            embed = discord.Embed(
-                title="❌ Not Playing",
-                description="Nothing is currently playing!",
-                color=0xff0000
-            )
+            embed = error_embed("❌ Not Playing", "Nothing is currently playing!")
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
         
         # Clear queue
-        while not player.queue.empty():
-            try:
-                player.queue.get_nowait()
-            except:
-                break
+        player.queue.clear()
         
         # Stop playback
         interaction.guild.voice_client.stop()
         
-        embed = discord.Embed(
-            title="⏹️ Stopped",
-            description="Playback stopped and queue cleared!",
-            color=0x00ff00
-        )
+        embed = info_embed("⏹️ Stopped", "Playback stopped and queue cleared!")
         await interaction.response.send_message(embed=embed)
     
 # disconnect command moved to playback cog to avoid conflicts
@@ -7,6 +7,8 @@ from discord import app_commands
 import logging
 from typing import Optional
 
+from utils.formatting import error_embed
+
 logger = logging.getLogger('hertz.playback')
 
 class Playback(commands.Cog):
@@ -18,9 +20,7 @@ class Playback(commands.Cog):
     def get_player(self, guild_id: int):
         """Get player for guild"""
         music_cog = self.bot.get_cog('Music')
-        if music_cog and guild_id in music_cog.players:
-            return music_cog.players[guild_id]
-        return None
+        return music_cog.players.get(guild_id) if music_cog else None
     
     @app_commands.command(name="volume", description="Set playback volume")
     @app_commands.describe(level="Volume level (0-100)")
@@ -29,11 +29,7 @@ class Playback(commands.Cog):
         player = self.get_player(interaction.guild.id)
         
         if not player:
-            embed = discord.Embed(
-                title="❌ Not Playing",
-                description="Nothing is currently playing!",
-                color=0xff0000
-            )
+            embed = error_embed("❌ Not Playing", "Nothing is currently playing!")
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
         
@@ -49,11 +45,7 @@ class Playback(commands.Cog):
         
         # Validate level
         if level < 0 or level > 100:
-            embed = discord.Embed(
-                title="❌ Invalid Volume",
-                description="Volume must be between 0 and 100!",
-                color=0xff0000
-            )
+            embed = error_embed("❌ Invalid Volume", "Volume must be between 0 and 100!")
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
         
@@ -87,11 +79,7 @@ class Playback(commands.Cog):
         player = self.get_player(interaction.guild.id)
         
         if not player:
-            embed = discord.Embed(
-                title="❌ Not Playing",
-                description="Nothing is currently playing!",
-                color=0xff0000
-            )
+            embed = error_embed("❌ Not Playing", "Nothing is currently playing!")
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
         
@@ -108,28 +96,19 @@ class Playback(commands.Cog):
     async def disconnect(self, interaction: discord.Interaction):
         """Disconnect bot from voice"""
         if not interaction.guild.voice_client:
-            embed = discord.Embed(
-                title="❌ Not Connected",
-                description="I'm not connected to a voice channel!",
-                color=0xff0000
-            )
+            embed = error_embed("❌ Not Connected", "I'm not connected to a voice channel!")
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
         
         # Clean up player
-        if interaction.guild.id in self.bot.get_cog('Music').players:
-            player = self.bot.get_cog('Music').players[interaction.guild.id]
-            
+        music_cog = self.bot.get_cog('Music')
+        player = music_cog.players.pop(interaction.guild.id, None) if music_cog else None
+        if player:
             # Clear queue
-            while not player.queue.empty():
-                try:
-                    player.queue.get_nowait()
-                except:
-                    break
+            player.queue.clear()
             
             # Destroy player
             player.destroy()
-            del self.bot.get_cog('Music').players[interaction.guild.id]
         
         # Disconnect
         await interaction.guild.voice_client.disconnect()
@@ -148,21 +127,13 @@ class Playback(commands.Cog):
         player = self.get_player(interaction.guild.id)
         
         if not player or not player.current:
-            embed = discord.Embed(
-                title="❌ Not Playing",
-                description="Nothing is currently playing!",
-                color=0xff0000
-            )
+            embed = error_embed("❌ Not Playing", "Nothing is currently playing!")
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
         
         # Validate position
         if player.current.duration and position > player.current.duration:
-            embed = discord.Embed(
-                title="❌ Invalid Position",
-                description=f"Position cannot exceed track duration ({player.current.duration}s)!",
-                color=0xff0000
-            )
+            embed = error_embed("❌ Invalid Position", f"Position cannot exceed track duration ({player.current.duration}s)!")
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
         
@@ -4,28 +4,51 @@ Queue Management Cog - Handle queue display, shuffle, loop modes
 import discord
 from discord.ext import commands
 from discord import app_commands
-import asyncio
-import random
+import itertools
 import logging
-from typing import Optional, List
-from datetime import datetime, timezone
+import time
+from collections import OrderedDict
+from typing import Iterator, Optional
+
+from utils.formatting import error_embed, format_duration
 
 logger = logging.getLogger('hertz.queue')
 
+# Rendered queue pages kept for reuse while the queue is unchanged
+PAGE_CACHE_SIZE = 32
+
 class QueueView(discord.ui.View):
     """Interactive queue view with pagination"""
     
-    def __init__(self, queue_data: List, current_page: int = 0):
+    def __init__(self, player, page_cache: OrderedDict, current_page: int = 0):
         super().__init__(timeout=60)
-        self.queue_data = queue_data
+        self.player = player
+        self.page_cache = page_cache
         self.current_page = current_page
-        self.max_page = (len(queue_data) - 1) // 10
         
         # Update button states
         self.update_buttons()
     
+    @property
+    def track_count(self) -> int:
+        """Number of tracks shown, including queue-loop tracks"""
+        count = len(self.player.queue)
+        if self.player.loop_mode == 'queue':
+            count += len(self.player.queue_list)
+        return count
+    
+    def iter_tracks(self) -> Iterator:
+        """Iterate the live queue, followed by queue-loop tracks when looping"""
+        if self.player.loop_mode == 'queue' and self.player.queue_list:
+            return itertools.chain(self.player.queue, self.player.queue_list)
+        return iter(self.player.queue)
+    
     def update_buttons(self):
         """Update button states based on current page"""
+        # The queue is read live, so recompute the page count each time
+        self.max_page = max(0, (self.track_count - 1) // 10)
+        self.current_page = min(self.current_page, self.max_page)
+        
         self.first_page.disabled = self.current_page == 0
         self.prev_page.disabled = self.current_page == 0
         self.next_page.disabled = self.current_page >= self.max_page
@@ -34,35 +57,52 @@ class QueueView(discord.ui.View):
     def get_embed(self) -> discord.Embed:
         """Get embed for current page"""
         start = self.current_page * 10
-        end = min(start + 10, len(self.queue_data))
+        track_count = self.track_count
         
         embed = discord.Embed(
             title="📜 Queue",
             color=0x00ff00
         )
         
-        if not self.queue_data:
+        if not track_count:
             embed.description = "Queue is empty! Use `/play` to add songs."
             return embed
         
-        description = ""
-        for i, track in enumerate(self.queue_data[start:end], start=start+1):
-            title = track.get('title', 'Unknown')[:50]
-            duration = track.get('duration', 0)
+        embed.description = self.get_page_text(start)
+        embed.set_footer(text=f"Page {self.current_page + 1}/{self.max_page + 1} • {track_count} tracks")
+        
+        return embed
+    
+    def get_page_text(self, start: int) -> str:
+        """Render the track list for a page, reusing it while the queue is unchanged"""
+        loop_tracks = len(self.player.queue_list) if self.player.loop_mode == 'queue' else -1
+        key = (self.player.guild.id, self.player.queue.version, loop_tracks, start)
+        
+        text = self.page_cache.get(key)
+        if text is not None:
+            self.page_cache.move_to_end(key)
+            return text
+        
+        lines = []
+        page_tracks = itertools.islice(self.iter_tracks(), start, start + 10)
+        for i, track in enumerate(page_tracks, start=start+1):
+            title = track.title[:50]
+            duration = track.duration
             if duration:
-                duration_str = f"{duration // 60}:{duration % 60:02d}"
+                duration_str = format_duration(duration)
             else:
                 duration_str = "Live"
             
-            requester = track.get('requester')
+            requester = track.requester
             requester_str = f" - {requester.mention}" if requester else ""
             
-            description += f"**{i}.** {title} [{duration_str}]{requester_str}\n"
-        
-        embed.description = description
-        embed.set_footer(text=f"Page {self.current_page + 1}/{self.max_page + 1} • {len(self.queue_data)} tracks")
+            lines.append(f"**{i}.** {title} [{duration_str}]{requester_str}")
         
-        return embed
+        text = "\n".join(lines)
+        self.page_cache[key] = text
+        if len(self.page_cache) > PAGE_CACHE_SIZE:
+            self.page_cache.popitem(last=False)
+        return text
     
     @discord.ui.button(label="⏮️", style=discord.ButtonStyle.secondary)
     async def first_page(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -98,13 +138,12 @@ class Queue(commands.Cog):
     
     def __init__(self, bot):
         self.bot = bot
+        self.page_cache = OrderedDict()
     
     def get_player(self, guild_id: int):
         """Get player for guild"""
         music_cog = self.bot.get_cog('Music')
-        if music_cog and guild_id in music_cog.players:
-            return music_cog.players[guild_id]
-        return None
+        return music_cog.players.get(guild_id) if music_cog else None
     
     @app_commands.command(name="queue", description="Show the current queue")
     @app_commands.describe(page="Page number to display")
@@ -121,36 +160,15 @@ class Queue(commands.Cog):
             await interaction.response.send_message(embed=embed)
             return
         
-        # Get queue items
-        queue_list = []
-        temp_queue = []
-        
-        # Extract items from asyncio.Queue
-        while not player.queue.empty():
-            try:
-                item = player.queue.get_nowait()
-                queue_list.append(item)
-                temp_queue.append(item)
-            except:
-                break
-        
-        # Put items back
-        for item in temp_queue:
-            await player.queue.put(item)
-        
-        # Add queue loop items if any
-        if player.loop_mode == 'queue' and player.queue_list:
-            queue_list.extend(player.queue_list)
-        
-        # Create view with pagination
-        view = QueueView(queue_list, current_page=max(0, page - 1))
+        # Create view with pagination over the live queue
+        view = QueueView(player, self.page_cache, current_page=max(0, page - 1))
         embed = view.get_embed()
         
         # Add currently playing
         if player.current:
             now_playing = f"🎵 **Now Playing:** [{player.current.title}]({player.current.webpage_url})"
             if player.current.duration:
-                duration = f"{player.current.duration // 60}:{player.current.duration % 60:02d}"
+                duration = format_duration(player.current.duration)
                 now_playing += f" [{duration}]"
             
             embed.add_field(
@@ -160,10 +178,12 @@ class Queue(commands.Cog):
             )
         
         # Add queue stats
-        total_duration = sum(track.get('duration', 0) for track in queue_list if track.get('duration'))
+        total_duration = player.queue.total_duration
+        if player.loop_mode == 'queue' and player.queue_list:
+            total_duration += sum(track.duration for track in player.queue_list if track.duration)
         if total_duration:
-            hours = total_duration // 3600
-            minutes = (total_duration % 3600) // 60
+            hours, remainder = divmod(int(total_duration), 3600)
+            minutes = remainder // 60
             duration_str = f"{hours}h {minutes}m" if hours else f"{minutes}m"
             
             embed.add_field(
@@ -178,7 +198,7 @@ class Queue(commands.Cog):
             inline=True
         )
         
-        await interaction.response.send_message(embed=embed, view=view if queue_list else None)
+        await interaction.response.send_message(embed=embed, view=view if view.track_count else None)
     
     @app_commands.command(name="shuffle", description="Shuffle the queue")
     async def shuffle(self, interaction: discord.Interaction):
@@ -186,32 +206,15 @@ class Queue(commands.Cog):
         player = self.get_player(interaction.guild.id)
         
         if not player or player.queue.empty():
-            embed = discord.Embed(
-                title="❌ Empty Queue",
-                description="There are no songs in the queue to shuffle!",
-                color=0xff0000
-            )
+            embed = error_embed("❌ Empty Queue", "There are no songs in the queue to shuffle!")
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
         
-        # Extract queue items
-        queue_items = []
-        while not player.queue.empty():
-            try:
-                queue_items.append(player.queue.get_nowait())
-            except:
-                break
-        
-        # Shuffle
-        random.shuffle(queue_items)
-        
-        # Put back
-        for item in queue_items:
-            await player.queue.put(item)
+        count = player.queue.shuffle()
         
         embed = discord.Embed(
             title="🔀 Shuffled",
-            description=f"Shuffled **{len(queue_items)}** tracks in the queue!",
+            description=f"Shuffled **{count}** tracks in the queue!",
             color=0x00ff00
         )
         await interaction.response.send_message(embed=embed)
@@ -228,11 +231,7 @@ class Queue(commands.Cog):
         player = self.get_player(interaction.guild.id)
         
         if not player:
-            embed = discord.Embed(
-                title="❌ Not Playing",
-                description="Nothing is currently playing!",
-                color=0xff0000
-            )
+            embed = error_embed("❌ Not Playing", "Nothing is currently playing!")
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
         
@@ -271,22 +270,12 @@ class Queue(commands.Cog):
         player = self.get_player(interaction.guild.id)
         
         if not player:
-            embed = discord.Embed(
-                title="❌ Empty Queue",
-                description="The queue is already empty!",
-                color=0xff0000
-            )
+            embed = error_embed("❌ Empty Queue", "The queue is already empty!")
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
         
-        # Count items
-        count = 0
-        while not player.queue.empty():
-            try:
-                player.queue.get_nowait()
-                count += 1
-            except:
-                break
+        # Clear queue
+        count = player.queue.clear()
         
         # Clear queue loop list
         player.queue_list.clear()
@@ -305,46 +294,23 @@ class Queue(commands.Cog):
         player = self.get_player(interaction.guild.id)
         
         if not player or player.queue.empty():
-            embed = discord.Embed(
-                title="❌ Empty Queue",
-                description="The queue is empty!",
-                color=0xff0000
-            )
+            embed = error_embed("❌ Empty Queue", "The queue is empty!")
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
         
-        # Extract queue items
-        queue_items = []
-        while not player.queue.empty():
-            try:
-                queue_items.append(player.queue.get_nowait())
-            except:
-                break
-        
         # Check position
-        if position < 1 or position > len(queue_items):
-            # Put items back
-            for item in queue_items:
-                await player.queue.put(item)
-            
-            embed = discord.Embed(
-                title="❌ Invalid Position",
-                description=f"Position must be between 1 and {len(queue_items)}!",
-                color=0xff0000
-            )
+        queue_size = player.queue.qsize()
+        if position < 1 or position > queue_size:
+            embed = error_embed("❌ Invalid Position", f"Position must be between 1 and {queue_size}!")
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
         
         # Remove track
-        removed = queue_items.pop(position - 1)
-        
-        # Put remaining items back
-        for item in queue_items:
-            await player.queue.put(item)
+        removed = player.queue.remove(position - 1)
         
         embed = discord.Embed(
             title="✅ Track Removed",
-            description=f"Removed **{removed.get('title', 'Unknown')}** from position {position}!",
+            description=f"Removed **{removed.title}** from position {position}!",
             color=0x00ff00
         )
         await interaction.response.send_message(embed=embed)
@@ -359,48 +325,24 @@ class Queue(commands.Cog):
         player = self.get_player(interaction.guild.id)
         
         if not player or player.queue.empty():
-            embed = discord.Embed(
-                title="❌ Empty Queue",
-                description="The queue is empty!",
-                color=0xff0000
-            )
+            embed = error_embed("❌ Empty Queue", "The queue is empty!")
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
         
-        # Extract queue items
-        queue_items = []
-        while not player.queue.empty():
-            try:
-                queue_items.append(player.queue.get_nowait())
-            except:
-                break
-        
         # Check positions
-        if (from_pos < 1 or from_pos > len(queue_items) or 
-            to_pos < 1 or to_pos > len(queue_items)):
-            # Put items back
-            for item in queue_items:
-                await player.queue.put(item)
-            
-            embed = discord.Embed(
-                title="❌ Invalid Position",
-                description=f"Positions must be between 1 and {len(queue_items)}!",
-                color=0xff0000
-            )
+        queue_size = player.queue.qsize()
+        if (from_pos < 1 or from_pos > queue_size or 
+            to_pos < 1 or to_pos > queue_size):
+            embed = error_embed("❌ Invalid Position", f"Positions must be between 1 and {queue_size}!")
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
         
         # Move track
-        track = queue_items.pop(from_pos - 1)
-        queue_items.insert(to_pos - 1, track)
-        
-        # Put items back
-        for item in queue_items:
-            await player.queue.put(item)
+        track = player.queue.move(from_pos - 1, to_pos - 1)
         
         embed = discord.Embed(
             title="✅ Track Moved",
-            description=f"Moved **{track.get('title', 'Unknown')}** from position {from_pos} to {to_pos}!",
+            description=f"Moved **{track.title}** from position {from_pos} to {to_pos}!",
             color=0x00ff00
         )
         await interaction.response.send_message(embed=embed)
@@ -411,56 +353,56 @@ class Queue(commands.Cog):
         player = self.get_player(interaction.guild.id)
         
         if not player or not player.current:
-            embed = discord.Embed(
-                title="❌ Not Playing",
-                description="Nothing is currently playing!",
-                color=0xff0000
-            )
+            embed = error_embed("❌ Not Playing", "Nothing is currently playing!")
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
         
         current = player.current
         
-        # Create detailed embed
-        embed = discord.Embed(
-            title="🎵 Now Playing",
-            description=f"**[{current.title}]({current.webpage_url})**",
-            color=0x00ff00
-        )
-        
-        if current.thumbnail:
-            embed.set_thumbnail(url=current.thumbnail)
-        
         # Add fields
+        fields = []
         if current.artist != 'Unknown Artist':
-            embed.add_field(name="Artist", value=current.artist, inline=True)
+            fields.append({"name": "Artist", "value": current.artist, "inline": True})
         
         if current.duration:
-            duration = f"{current.duration // 60}:{current.duration % 60:02d}"
-            embed.add_field(name="Duration", value=duration, inline=True)
+            duration = format_duration(current.duration)
+            fields.append({"name": "Duration", "value": duration, "inline": True})
         else:
-            embed.add_field(name="Duration", value="Live Stream", inline=True)
+            fields.append({"name": "Duration", "value": "Live Stream", "inline": True})
         
-        embed.add_field(name="Volume", value=f"{int(player.volume * 100)}%", inline=True)
-        embed.add_field(name="Loop Mode", value=player.loop_mode.title(), inline=True)
+        fields.append({"name": "Volume", "value": f"{int(player.volume * 100)}%", "inline": True})
+        fields.append({"name": "Loop Mode", "value": player.loop_mode.title(), "inline": True})
         
         # Queue size
         queue_size = player.queue.qsize()
-        embed.add_field(name="Queue Size", value=f"{queue_size} tracks", inline=True)
+        fields.append({"name": "Queue Size", "value": f"{queue_size} tracks", "inline": True})
         
         # Time playing
-        time_playing = (datetime.now(datetime.UTC) - current.added_at).seconds
-        embed.add_field(
-            name="Playing For",
-            value=f"{time_playing // 60}:{time_playing % 60:02d}",
-            inline=True
-        )
+        time_playing = int(time.monotonic() - current.started_at)
+        fields.append({
+            "name": "Playing For",
+            "value": format_duration(time_playing),
+            "inline": True
+        })
+        
+        # Create detailed embed in one pass
+        payload = {
+            "title": "🎵 Now Playing",
+            "description": f"**[{current.title}]({current.webpage_url})**",
+            "color": 0x00ff00,
+            "fields": fields
+        }
+        
+        if current.thumbnail:
+            payload["thumbnail"] = {"url": current.thumbnail}
         
         if current.requester:
-            embed.set_footer(
-                text=f"Requested by {current.requester}",
-                icon_url=current.requester.avatar.url if current.requester.avatar else None
-            )
+            footer = {"text": f"Requested by {current.requester}"}
+            if current.requester.avatar:
+                footer["icon_url"] = current.requester.avatar.url
+            payload["footer"] = footer
+        
+        embed = discord.Embed.from_dict(payload)
         
         await interaction.response.send_message(embed=embed)
 
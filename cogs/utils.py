@@ -10,6 +10,8 @@ import psutil
 from datetime import datetime, timezone
 from typing import Optional
 
+from utils.formatting import error_embed
+
 logger = logging.getLogger('hertz.utils')
 
 class Utils(commands.Cog):
@@ -27,11 +29,7 @@ class Utils(commands.Cog):
             # Show specific command help
             cmd = self.bot.tree.get_command(command)
             if not cmd:
-                embed = discord.Embed(
-                    title="❌ Command Not Found",
-                    description=f"Command `{command}` does not exist!",
-                    color=0xff0000
-                )
+                embed = error_embed("❌ Command Not Found", f"Command `{command}` does not exist!")
                 await interaction.response.send_message(embed=embed, ephemeral=True)
                 return
             
@@ -143,7 +141,7 @@ class Utils(commands.Cog):
         """Display bot statistics"""
         
         # Calculate uptime
-        uptime = datetime.now(datetime.UTC) - self.bot.start_time
+        uptime = datetime.now(timezone.utc) - self.bot.start_time
         hours, remainder = divmod(int(uptime.total_seconds()), 3600)
         minutes, seconds = divmod(remainder, 60)
         days, hours = divmod(hours, 24)
@@ -182,7 +180,7 @@ class Utils(commands.Cog):
         embed.add_field(
             name="Server Info",
             value=f"**Guilds:** {len(self.bot.guilds)}\n"
-                  f"**Users:** {sum(g.member_count for g in self.bot.guilds)}\n"
+                  f"**Users:** {sum(g.member_count or 0 for g in self.bot.guilds)}\n"
                   f"**Voice:** {voice_connections} connected",
             inline=True
         )
@@ -0,0 +1,4 @@
+"""
+Hertz Bot Utilities Package
+Shared helpers used across cogs
+"""
\ No newline at end of file
@@ -0,0 +1,22 @@
+"""
+Shared formatting helpers for embeds and durations
+"""
+import discord
+import functools
+
+
+@functools.lru_cache(maxsize=4096)
+def format_duration(seconds: int) -> str:
+    """Format a duration in seconds as M:SS"""
+    minutes, seconds = divmod(int(seconds), 60)
+    return f"{minutes}:{seconds:02d}"
+
+
+def info_embed(title: str, description: str, color: int = 0x00ff00) -> discord.Embed:
+    """Build a simple title/description embed"""
+    return discord.Embed(title=title, description=description, color=color)
+
+
+def error_embed(title: str, description: str) -> discord.Embed:
+    """Build an error embed"""
+    return discord.Embed(title=title, description=description, color=0xff0000)
\ No newline at end of file
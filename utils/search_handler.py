@@ -2,18 +2,20 @@
 Advanced Search Handler with caching and multiple sources
 Minimizes YouTube API usage like Muse does
 """
-import asyncio
 import aiohttp
 import re
-import json
 import logging
 from typing import List, Dict, Optional, Any
-from datetime import datetime, timezone, timedelta
-import hashlib
-import os
+from datetime import datetime, timedelta
 
 logger = logging.getLogger('hertz.search')
 
+# Shared read-only fallback for missing nested API fields; never mutate it
+_EMPTY: Dict[str, Any] = {}
+
+# ISO 8601 durations as returned by the YouTube Data API, e.g. PT1H2M3S
+ISO_DURATION_PATTERN = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?')
+
 class SearchCache:
     """In-memory cache for search results"""
     
@@ -80,7 +82,7 @@ class YouTubeSearchHandler:
         cache_key = f"scrape:{query}:{limit}"
         cached = self.cache.get(cache_key)
         if cached:
-            logger.debug(f"Cache hit for query: {query}")
+            logger.debug("Cache hit for query: %s", query)
             return cached
         
         results = []
@@ -110,19 +112,20 @@ class YouTubeSearchHandler:
                             
                             for item in data[:limit]:
                                 if item.get('type') == 'video':
+                                    thumbnails = item.get('videoThumbnails')
                                     results.append({
                                         'title': item.get('title', 'Unknown'),
                                         'url': f"https://youtube.com/watch?v={item.get('videoId')}",
                                         'duration': item.get('lengthSeconds', 0),
                                         'channel': item.get('author', 'Unknown'),
-                                        'thumbnail': item.get('videoThumbnails', [{}])[0].get('url'),
+                                        'thumbnail': thumbnails[0].get('url') if thumbnails else None,
                                         'views': item.get('viewCount', 0)
                                     })
                             
                             if results:
                                 break
                 except Exception as e:
-                    logger.debug(f"Invidious instance {instance} failed: {e}")
+                    logger.debug("Invidious instance %s failed: %s", instance, e)
                     continue
             
             # Cache results
@@ -163,7 +166,7 @@ class YouTubeSearchHandler:
                 if response.status == 200:
                     data = await response.json()
                     
-                    video_ids = [item['id']['videoId'] for item in data.get('items', [])]
+                    video_ids = [item['id']['videoId'] for item in data.get('items', ())]
                     
                     if video_ids:
                         # Get video details for duration
@@ -177,15 +180,15 @@ class YouTubeSearchHandler:
                         async with self.session.get(details_url, params=details_params) as detail_response:
                             if detail_response.status == 200:
                                 details = await detail_response.json()
-                                detail_map = {item['id']: item for item in details.get('items', [])}
+                                detail_map = {item['id']: item for item in details.get('items', ())}
                         
-                        for item in data.get('items', []):
+                        for item in data.get('items', ()):
                             video_id = item['id']['videoId']
                             snippet = item['snippet']
-                            details = detail_map.get(video_id, {})
+                            details = detail_map.get(video_id, _EMPTY)
                             
                             # Parse duration
-                            duration_str = details.get('contentDetails', {}).get('duration', 'PT0S')
+                            duration_str = details.get('contentDetails', _EMPTY).get('duration', 'PT0S')
                             duration = self._parse_duration(duration_str)
                             
                             results.append({
@@ -193,8 +196,8 @@ class YouTubeSearchHandler:
                                 'url': f"https://youtube.com/watch?v={video_id}",
                                 'duration': duration,
                                 'channel': snippet.get('channelTitle', 'Unknown'),
-                                'thumbnail': snippet.get('thumbnails', {}).get('high', {}).get('url'),
-                                'views': int(details.get('statistics', {}).get('viewCount', 0))
+                                'thumbnail': snippet.get('thumbnails', _EMPTY).get('high', _EMPTY).get('url'),
+                                'views': int(details.get('statistics', _EMPTY).get('viewCount', 0))
                             })
             
             # Cache results
@@ -221,10 +224,7 @@ class YouTubeSearchHandler:
     
     def _parse_duration(self, duration_str: str) -> int:
         """Parse ISO 8601 duration to seconds"""
-        import re
-        
-        pattern = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?')
-        match = pattern.match(duration_str)
+        match = ISO_DURATION_PATTERN.match(duration_str)
         
         if not match:
             return 0
@@ -288,7 +288,7 @@ class SearchAggregator:
                 self.suggestion_cache.set(cache_key, suggestions)
                 
         except Exception as e:
-            logger.debug(f"Failed to get suggestions: {e}")
+            logger.debug("Failed to get suggestions: %s", e)
         
         return suggestions
     